@@ -1,7 +1,8 @@
 import express from "express";
 import type { ParsedQs } from "qs";
 import http from "http";
-import { WebSocketServer } from "ws";
+import { WebSocketServer, type WebSocket } from "ws";
+import { ConsoleLogger } from "@vuhlp/providers";
 import type { Runtime } from "../runtime/runtime.js";
 import type {
   CreateEdgeRequest,
@@ -15,12 +16,27 @@ import type {
   UpdateTemplateRequest
 } from "@vuhlp/contracts";
 
+const logger = new ConsoleLogger({ scope: "api" });
+
+/** True when an If-None-Match header (a list of tags, or "*") names the given ETag. */
+function matchesIfNoneMatch(header: string | undefined, etag: string): boolean {
+  if (!header) {
+    return false;
+  }
+  return header
+    .split(",")
+    .map((tag) => tag.trim())
+    .some((tag) => tag === "*" || tag === etag || tag === `W/${etag}`);
+}
+
 export function createServer(runtime: Runtime): http.Server {
   const app = express();
   app.use(express.json({ limit: "4mb" }));
 
   const DEFAULT_EVENTS_PAGE_SIZE = 200;
   const MAX_EVENTS_PAGE_SIZE = 2000;
+  const MAX_SOCKET_BUFFERED_BYTES = 8 * 1024 * 1024;
+  const HEARTBEAT_INTERVAL_MS = 30_000;
 
   const getQueryString = (value: string | string[] | ParsedQs | ParsedQs[] | undefined): string | undefined => {
     if (typeof value === "string") {
@@ -236,7 +252,18 @@ export function createServer(runtime: Runtime): http.Server {
 
   app.get("/api/runs/:id/artifacts/:artifactId", async (req, res) => {
     try {
+      // Artifact files are written once under a unique id, so the id is a stable validator
+      // and repeat fetches can be answered with 304 without reading the file.
+      const artifact = runtime.getArtifact(req.params.id, req.params.artifactId);
+      const etag = `"${artifact.id}"`;
+      if (matchesIfNoneMatch(req.headers["if-none-match"], etag)) {
+        res.setHeader("ETag", etag);
+        res.status(304).end();
+        return;
+      }
       const result = await runtime.getArtifactContent(req.params.id, req.params.artifactId);
+      res.setHeader("ETag", etag);
+      res.setHeader("Cache-Control", "private, max-age=31536000, immutable");
       res.json(result);
     } catch (error) {
       res.status(404).json({ error: String(error) });
@@ -290,21 +317,75 @@ export function createServer(runtime: Runtime): http.Server {
     }
   });
 
+  // Unmatched API paths end here with the same JSON error shape as the routes above,
+  // instead of falling through to Express's default HTML 404 page.
+  app.use("/api", (req, res) => {
+    res.status(404).json({ error: `Not found: ${req.method} ${req.originalUrl}` });
+  });
+
   const server = http.createServer(app);
   const wss = new WebSocketServer({ server, path: "/ws" });
 
-  wss.on("connection", (socket, req) => {
-    const url = new URL(req.url ?? "/ws", `http://${req.headers.host ?? "localhost"}`);
-    const runId = url.searchParams.get("runId");
-    const unsubscribe = runtime.onEvent((event) => {
+  // Socket -> runId filter (null receives every run). A single bus listener serializes
+  // each event at most once and fans the frame out to every matching socket.
+  const subscribers = new Map<WebSocket, string | null>();
+  const unsubscribe = runtime.onEvent((event) => {
+    let payload: string | null = null;
+    for (const [socket, runId] of subscribers) {
       if (runId && event.runId !== runId) {
-        return;
+        continue;
+      }
+      if (socket.readyState !== socket.OPEN) {
+        continue;
       }
-      if (socket.readyState === socket.OPEN) {
-        socket.send(JSON.stringify(event));
+      if (socket.bufferedAmount > MAX_SOCKET_BUFFERED_BYTES) {
+        // Dropping individual events would silently desync the client's run state, so cut
+        // the stalled connection instead; clients refetch recent events on reconnect.
+        logger.warn("terminating stalled websocket client", {
+          runId,
+          bufferedAmount: socket.bufferedAmount
+        });
+        subscribers.delete(socket);
+        socket.terminate();
+        continue;
       }
+      payload ??= JSON.stringify(event);
+      socket.send(payload);
+    }
+  });
+
+  // One shared timer pings every client; a socket that has not answered the previous
+  // ping by the next tick is treated as dead and dropped. Clients refetch recent events
+  // on reconnect, so nothing missed while the link was dead is lost.
+  const awaitingPong = new Set<WebSocket>();
+  const heartbeat = setInterval(() => {
+    for (const socket of wss.clients) {
+      if (awaitingPong.has(socket)) {
+        logger.warn("terminating unresponsive websocket client", { runId: subscribers.get(socket) ?? null });
+        awaitingPong.delete(socket);
+        subscribers.delete(socket);
+        socket.terminate();
+        continue;
+      }
+      awaitingPong.add(socket);
+      socket.ping();
+    }
+  }, HEARTBEAT_INTERVAL_MS);
+  heartbeat.unref();
+
+  server.on("close", () => {
+    clearInterval(heartbeat);
+    unsubscribe();
+  });
+
+  wss.on("connection", (socket, req) => {
+    const url = new URL(req.url ?? "/ws", `http://${req.headers.host ?? "localhost"}`);
+    subscribers.set(socket, url.searchParams.get("runId"));
+    socket.on("pong", () => awaitingPong.delete(socket));
+    socket.on("close", () => {
+      subscribers.delete(socket);
+      awaitingPong.delete(socket);
     });
-    socket.on("close", () => unsubscribe());
   });
 
   return server;
@@ -8,9 +8,6 @@ import { createServer } from "./api/server.js";
 const logger = new ConsoleLogger({ scope: "daemon" });
 
 function loadEnvFile(filePath: string): void {
-  if (!existsSync(filePath)) {
-    return;
-  }
   try {
     const content = readFileSync(filePath, "utf8");
     for (const line of content.split(/\r?\n/)) {
@@ -36,6 +33,10 @@ function loadEnvFile(filePath: string): void {
       process.env[key] = value;
     }
   } catch (error) {
+    // A missing file means there is no env file to load, not a failure.
+    if (error instanceof Error && "code" in error && error.code === "ENOENT") {
+      return;
+    }
     const message = error instanceof Error ? error.message : String(error);
     logger.warn("failed to load env file", { filePath, message });
   }
@@ -903,7 +903,7 @@ export class CliRunner implements NodeRunner {
       this.refreshSessionConfig(existing, input);
       return existing;
     }
-    const spec = this.providerResolver.resolve(input.config.provider);
+    const spec = await this.providerResolver.resolve(input.config.provider);
     if (!spec) {
       return null;
     }
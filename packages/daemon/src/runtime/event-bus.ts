@@ -1,17 +1,18 @@
-import { EventEmitter } from "events";
 import type { EventEnvelope } from "@vuhlp/contracts";
 
 export type EventListener = (event: EventEnvelope) => void;
 
 export class EventBus {
-  private emitter = new EventEmitter();
+  private readonly listeners = new Set<EventListener>();
 
   on(listener: EventListener): () => void {
-    this.emitter.on("event", listener);
-    return () => this.emitter.off("event", listener);
+    this.listeners.add(listener);
+    return () => this.listeners.delete(listener);
   }
 
   emit(event: EventEnvelope): void {
-    this.emitter.emit("event", event);
+    for (const listener of this.listeners) {
+      listener(event);
+    }
   }
 }
@@ -1,10 +1,12 @@
 import { createReadStream, promises as fs } from "fs";
+import type { FileHandle } from "fs/promises";
 import path from "path";
 import { createInterface } from "readline";
 import type { EventEnvelope, UUID } from "@vuhlp/contracts";
 import type { Logger } from "@vuhlp/providers";
 
 const EVENT_LOG_BLOCK_SIZE = 64 * 1024;
+const EVENT_LOG_IDLE_CLOSE_MS = 5_000;
 
 export interface EventLogPage {
   events: EventEnvelope[];
@@ -17,6 +19,12 @@ interface ReadPageOptions {
   before?: number;
 }
 
+interface PendingLine {
+  line: string;
+  resolve: () => void;
+  reject: (error: Error) => void;
+}
+
 interface EventLogLine {
   offset: number;
   value: string;
@@ -27,6 +35,10 @@ export class EventLog {
   private readonly filePath: string;
   private readonly runId: UUID;
   private readonly logger?: Logger;
+  private pendingLines: PendingLine[] = [];
+  private flushing: Promise<void> | null = null;
+  private handle: FileHandle | null = null;
+  private idleTimer: ReturnType<typeof setTimeout> | null = null;
 
   constructor(baseDir: string, runId: UUID, logger?: Logger) {
     this.dir = path.join(baseDir, "runs", runId);
@@ -35,15 +47,105 @@ export class EventLog {
     this.logger = logger;
   }
 
+  /**
+   * Queue an event for the log. Events appended while a write is in flight are
+   * coalesced into the next write, so bursts cost one append per batch and land
+   * on disk in emit order. Each call settles with the write that carried its own
+   * line: it rejects only if that batch failed.
+   */
   async append(event: EventEnvelope): Promise<void> {
-    try {
+    const line = `${JSON.stringify(event)}\n`;
+    this.clearIdleTimer();
+    return new Promise<void>((resolve, reject) => {
+      this.pendingLines.push({ line, resolve, reject });
+      if (!this.flushing) {
+        this.flushing = this.flushPending();
+      }
+    });
+  }
+
+  /**
+   * Wait for queued events to be written, then release the append handle.
+   * A later append reopens it.
+   */
+  async close(): Promise<void> {
+    // An append during the wait starts a new flush on the current handle; drain until idle.
+    while (this.flushing) {
+      await this.flushing;
+    }
+    this.clearIdleTimer();
+    await this.releaseHandle();
+  }
+
+  private async flushPending(): Promise<void> {
+    while (this.pendingLines.length > 0) {
+      const batch = this.pendingLines;
+      this.pendingLines = [];
+      try {
+        const handle = await this.openHandle();
+        await handle.appendFile(batch.map((entry) => entry.line).join(""), "utf8");
+        this.logger?.debug("appended event log batch", { runId: this.runId, count: batch.length });
+        for (const entry of batch) {
+          entry.resolve();
+        }
+      } catch (error) {
+        const message = error instanceof Error ? error.message : String(error);
+        this.logger?.error("failed to append event log", { runId: this.runId, message, count: batch.length });
+        await this.releaseHandle();
+        const failure = error instanceof Error ? error : new Error(message);
+        for (const entry of batch) {
+          entry.reject(failure);
+        }
+      }
+    }
+    // No await between the empty-queue check and here, so no append can be stranded.
+    this.flushing = null;
+    this.scheduleIdleClose();
+  }
+
+  /**
+   * Close the append handle once the log has been quiet for EVENT_LOG_IDLE_CLOSE_MS,
+   * so open descriptors track recently active runs rather than every run since startup.
+   */
+  private scheduleIdleClose(): void {
+    this.clearIdleTimer();
+    this.idleTimer = setTimeout(() => {
+      this.idleTimer = null;
+      if (this.flushing || this.pendingLines.length > 0 || !this.handle) {
+        return;
+      }
+      this.logger?.debug("closing idle event log handle", { runId: this.runId });
+      void this.releaseHandle();
+    }, EVENT_LOG_IDLE_CLOSE_MS);
+    this.idleTimer.unref();
+  }
+
+  private clearIdleTimer(): void {
+    if (this.idleTimer) {
+      clearTimeout(this.idleTimer);
+      this.idleTimer = null;
+    }
+  }
+
+  private async openHandle(): Promise<FileHandle> {
+    if (!this.handle) {
       await fs.mkdir(this.dir, { recursive: true });
-      const line = `${JSON.stringify(event)}\n`;
-      await fs.appendFile(this.filePath, line, "utf8");
+      this.handle = await fs.open(this.filePath, "a");
+    }
+    return this.handle;
+  }
+
+  private async releaseHandle(): Promise<void> {
+    const handle = this.handle;
+    this.handle = null;
+    if (!handle) {
+      return;
+    }
+    try {
+      await handle.close();
     } catch (error) {
       const message = error instanceof Error ? error.message : String(error);
-      this.logger?.error("failed to append event log", { runId: this.runId, message });
-      throw error;
+      this.logger?.warn("failed to close event log", { runId: this.runId, message });
     }
   }
 
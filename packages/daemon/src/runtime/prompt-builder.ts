@@ -46,10 +46,16 @@ export interface PromptBuildOptions {
   toolProtocol?: string;
 }
 
+interface CachedTemplate {
+  mtimeMs: number;
+  size: number;
+  content: string;
+}
+
 export class PromptBuilder {
   private readonly repoRoot: string;
   private readonly systemTemplatesDir?: string;
-  private readonly templateCache = new Map<string, string>();
+  private readonly templateCache = new Map<string, CachedTemplate>();
   private readonly logger: Logger;
 
   constructor(repoRoot: string, systemTemplatesDir?: string, logger?: Logger) {
@@ -89,28 +95,19 @@ export class PromptBuilder {
       return input.config.customSystemPrompt;
     }
     const templateName = input.config.roleTemplate;
-    const cached = this.templateCache.get(templateName);
-    if (cached) {
-      return cached;
-    }
 
     // transform input.config.roleTemplate from "role" to "role.md"
     const fileName = `${templateName}.md`;
 
-    // Try repo root first
+    // Try repo root first, then the system templates dir
     const repoPath = path.resolve(this.repoRoot, "docs", "templates", fileName);
     try {
-      const content = await fs.readFile(repoPath, "utf8");
-      this.templateCache.set(templateName, content);
-      return content;
+      return await this.readTemplateFile(repoPath);
     } catch (error) {
-      // If not found and we have a system dir, try that
       if (this.systemTemplatesDir) {
         const systemPath = path.resolve(this.systemTemplatesDir, fileName);
         try {
-          const content = await fs.readFile(systemPath, "utf8");
-          this.templateCache.set(templateName, content);
-          return content;
+          return await this.readTemplateFile(systemPath);
         } catch (sysError) {
           // ignore, fall through to error handling
         }
@@ -121,10 +118,24 @@ export class PromptBuilder {
         message,
         template: templateName
       });
-      const fallback = `Role template not found: ${templateName}`;
-      this.templateCache.set(templateName, fallback);
-      return fallback;
+      return `Role template not found: ${templateName}`;
+    }
+  }
+
+  /**
+   * Read a template through the cache. Entries are keyed by path and revalidated
+   * against the file's mtime and size, so edits made through the template API (or
+   * on disk) reach the next turn without re-reading unchanged files.
+   */
+  private async readTemplateFile(filePath: string): Promise<string> {
+    const stats = await fs.stat(filePath);
+    const cached = this.templateCache.get(filePath);
+    if (cached && cached.mtimeMs === stats.mtimeMs && cached.size === stats.size) {
+      return cached.content;
     }
+    const content = await fs.readFile(filePath, "utf8");
+    this.templateCache.set(filePath, { mtimeMs: stats.mtimeMs, size: stats.size, content });
+    return content;
   }
 
   private buildTaskPayload(input: TurnInput): string {
@@ -5,7 +5,7 @@
  * and applies provider-specific defaults for CLI streaming.
  */
 
-import fs from "node:fs";
+import { promises as fs, type Stats } from "node:fs";
 import path from "node:path";
 import type { ProviderName } from "@vuhlp/contracts";
 import type { Logger, NativeToolHandling, ProviderProtocol } from "@vuhlp/providers";
@@ -33,13 +33,14 @@ export interface ProviderResolverOptions {
 export class ProviderResolver {
   private readonly appRoot: string;
   private readonly logger: Logger;
+  private readonly pathLookupCache = new Map<string, string>();
 
   constructor(options: ProviderResolverOptions) {
     this.appRoot = options.appRoot;
     this.logger = options.logger;
   }
 
-  resolve(provider: ProviderName): ProviderSpec | null {
+  async resolve(provider: ProviderName): Promise<ProviderSpec | null> {
     const prefix = provider.toUpperCase();
     const transportEnv = this.readEnv(`VUHLP_${prefix}_TRANSPORT`);
     const transport = transportEnv?.toLowerCase() === "api" ? "api" : "cli";
@@ -88,7 +89,7 @@ export class ProviderResolver {
     const explicitCommand = this.readEnv(`VUHLP_${prefix}_COMMAND`);
     let command = explicitCommand ?? provider;
     if (provider === "claude" && !explicitCommand) {
-      const localBinary = this.resolveLocalClaudeBinary();
+      const localBinary = await this.resolveLocalClaudeBinary();
       if (localBinary) {
         command = localBinary.path;
         this.logger.info("using local Claude CLI binary", {
@@ -105,7 +106,7 @@ export class ProviderResolver {
       }
     }
     if (provider === "codex" && !explicitCommand) {
-      const localBinary = this.resolveLocalCodexBinary();
+      const localBinary = await this.resolveLocalCodexBinary();
       if (localBinary) {
         command = localBinary.path;
         this.logger.info("using local Codex CLI binary", {
@@ -114,7 +115,7 @@ export class ProviderResolver {
           source: localBinary.source
         });
       } else {
-        const repoPath = this.resolveLocalCodexRepo();
+        const repoPath = await this.resolveLocalCodexRepo();
         if (repoPath) {
           const candidates = this.getLocalCodexBinaryCandidates(repoPath);
           this.logger.error("local Codex repo found but CLI binary missing", {
@@ -140,7 +141,7 @@ export class ProviderResolver {
     }
 
     if (provider === "gemini" && !explicitCommand) {
-      const localBinary = this.resolveLocalGeminiBinary();
+      const localBinary = await this.resolveLocalGeminiBinary();
       if (localBinary) {
         command = localBinary.path;
         this.logger.info("using local Gemini CLI bundle", {
@@ -148,7 +149,7 @@ export class ProviderResolver {
           path: localBinary.path
         });
       } else {
-        const repoPath = this.resolveLocalGeminiRepo();
+        const repoPath = await this.resolveLocalGeminiRepo();
         if (repoPath) {
           const expectedBundle = path.join(repoPath, "bundle", "gemini.js");
           this.logger.error("local Gemini repo found but bundle missing", {
@@ -241,17 +242,9 @@ export class ProviderResolver {
     return path.join(this.appRoot, "packages", "providers");
   }
 
-  private resolveLocalCodexRepo(): string | null {
+  private async resolveLocalCodexRepo(): Promise<string | null> {
     const repoPath = path.join(this.resolveProvidersRoot(), "codex");
-    if (!fs.existsSync(repoPath)) {
-      return null;
-    }
-    try {
-      const stats = fs.statSync(repoPath);
-      return stats.isDirectory() ? repoPath : null;
-    } catch {
-      return null;
-    }
+    return (await this.isDirectory(repoPath)) ? repoPath : null;
   }
 
   private getLocalCodexBinaryCandidates(repoPath: string): { release: string; debug: string } {
@@ -261,29 +254,37 @@ export class ProviderResolver {
     };
   }
 
-  private resolveLocalCodexBinary(): { path: string; source: "release" | "debug" } | null {
-    const repoPath = this.resolveLocalCodexRepo();
+  private async resolveLocalCodexBinary(): Promise<{ path: string; source: "release" | "debug" } | null> {
+    const repoPath = await this.resolveLocalCodexRepo();
     if (!repoPath) {
       return null;
     }
     const candidates = this.getLocalCodexBinaryCandidates(repoPath);
-    if (this.isExecutableFile(candidates.release)) {
+    if (await this.isExecutableFile(candidates.release)) {
       return { path: candidates.release, source: "release" };
     }
-    if (this.isExecutableFile(candidates.debug)) {
+    if (await this.isExecutableFile(candidates.debug)) {
       return { path: candidates.debug, source: "debug" };
     }
     return null;
   }
 
-  private isExecutableFile(candidate: string): boolean {
-    if (!fs.existsSync(candidate)) {
-      return false;
-    }
+  // Probes run on the daemon's event loop, so use async stats rather than blocking syscalls.
+  private async isExecutableFile(candidate: string): Promise<boolean> {
+    const stats = await this.statOrNull(candidate);
+    return stats?.isFile() ?? false;
+  }
+
+  private async isDirectory(candidate: string): Promise<boolean> {
+    const stats = await this.statOrNull(candidate);
+    return stats?.isDirectory() ?? false;
+  }
+
+  private async statOrNull(candidate: string): Promise<Stats | null> {
     try {
-      return fs.statSync(candidate).isFile();
+      return await fs.stat(candidate);
     } catch {
-      return false;
+      return null;
     }
   }
 
@@ -511,57 +512,60 @@ export class ProviderResolver {
     return null;
   }
 
-  private resolveLocalGeminiRepo(): string | null {
+  private async resolveLocalGeminiRepo(): Promise<string | null> {
     const repoPath = path.join(this.resolveProvidersRoot(), "gemini-cli");
-    if (!fs.existsSync(repoPath)) {
-      return null;
-    }
-    try {
-      const stats = fs.statSync(repoPath);
-      return stats.isDirectory() ? repoPath : null;
-    } catch {
-      return null;
-    }
+    return (await this.isDirectory(repoPath)) ? repoPath : null;
   }
 
-  private resolveLocalGeminiBinary(): { path: string } | null {
-    const repoPath = this.resolveLocalGeminiRepo();
+  private async resolveLocalGeminiBinary(): Promise<{ path: string } | null> {
+    const repoPath = await this.resolveLocalGeminiRepo();
     if (!repoPath) {
       return null;
     }
     const bundlePath = path.join(repoPath, "bundle", "gemini.js");
-    if (this.isExecutableFile(bundlePath)) {
+    if (await this.isExecutableFile(bundlePath)) {
       return { path: bundlePath };
     }
     return null;
   }
 
-  private resolveLocalClaudeBinary(): { path: string; source: "node-bin" | "path" } | null {
+  private async resolveLocalClaudeBinary(): Promise<{ path: string; source: "node-bin" | "path" } | null> {
     const nodeBin = path.join(path.dirname(process.execPath), "claude");
-    if (this.isExecutableFile(nodeBin)) {
+    if (await this.isExecutableFile(nodeBin)) {
       return { path: nodeBin, source: "node-bin" };
     }
-    const pathBinary = this.resolveCommandFromPath("claude");
+    const pathBinary = await this.resolveCommandFromPath("claude");
     if (pathBinary) {
       return { path: pathBinary, source: "path" };
     }
     return null;
   }
 
-  private resolveCommandFromPath(command: string): string | null {
+  private async resolveCommandFromPath(command: string): Promise<string | null> {
     if (path.isAbsolute(command)) {
-      return this.isExecutableFile(command) ? command : null;
+      return (await this.isExecutableFile(command)) ? command : null;
     }
     const pathEnv = this.readEnv("PATH");
     if (!pathEnv) {
       return null;
     }
     const extensions = this.getPathExtensions();
+    // Keyed on PATH/PATHEXT so env changes miss the cache; a cached hit is re-checked
+    // with one stat so an uninstalled binary falls back to a full scan.
+    const cacheKey = [command, pathEnv, ...extensions].join("\0");
+    const cached = this.pathLookupCache.get(cacheKey);
+    if (cached) {
+      if (await this.isExecutableFile(cached)) {
+        return cached;
+      }
+      this.pathLookupCache.delete(cacheKey);
+    }
     const entries = pathEnv.split(path.delimiter).filter((entry) => entry.length > 0);
     for (const entry of entries) {
       for (const ext of extensions) {
         const candidate = path.join(entry, `${command}${ext}`);
-        if (this.isExecutableFile(candidate)) {
+        if (await this.isExecutableFile(candidate)) {
+          this.pathLookupCache.set(cacheKey, candidate);
           return candidate;
         }
       }
@@ -56,6 +56,9 @@ const addUsage = (current: UsageTotals | undefined, delta: UsageTotals): UsageTo
 
 const getErrorCode = (error: { code?: string } | null | undefined): string | undefined => error?.code;
 
+const TEMPLATE_NAME_PATTERN = /^[a-zA-Z0-9_-]+$/;
+const PERSISTED_RUN_LOAD_CONCURRENCY = 16;
+
 export interface RuntimeOptions {
   dataDir: string;
   runner?: NodeRunner;
@@ -74,6 +77,7 @@ export class Runtime {
   private readonly dataDir: string;
   private readonly repoRoot: string;
   private readonly appRoot: string;
+  private readonly repoTemplatesDir: string;
   private readonly systemTemplatesDir?: string;
   private readonly logger: Logger;
   private readonly artifactStores = new Map<UUID, ArtifactStore>();
@@ -83,6 +87,7 @@ export class Runtime {
     this.dataDir = options.dataDir;
     this.repoRoot = path.resolve(options.repoRoot ?? process.cwd());
     this.appRoot = path.resolve(options.appRoot ?? this.repoRoot);
+    this.repoTemplatesDir = path.join(this.repoRoot, "docs", "templates");
     this.systemTemplatesDir = options.systemTemplatesDir;
     this.logger = options.logger ?? new ConsoleLogger({ scope: "runtime" });
     this.store = new RunStore(this.dataDir, this.logger);
@@ -165,6 +170,9 @@ export class Runtime {
     for (const runId of this.snapshotTimers.keys()) {
       await this.flushRunSnapshot(runId);
     }
+    for (const record of this.store.listRunRecords()) {
+      await record.eventLog.close();
+    }
 
     this.logger.info("runtime shutdown complete", { runs: this.store.listRuns().length });
   }
@@ -187,10 +195,10 @@ export class Runtime {
     if (!name) {
       throw new Error("template name is required");
     }
-    if (!/^[a-zA-Z0-9_-]+$/.test(name)) {
+    if (!TEMPLATE_NAME_PATTERN.test(name)) {
       throw new Error("invalid template name");
     }
-    const templatePath = path.resolve(this.repoRoot, "docs", "templates", `${name}.md`);
+    const templatePath = path.join(this.repoTemplatesDir, `${name}.md`);
     try {
       const content = await fs.readFile(templatePath, "utf8");
       return { name, content, found: true };
@@ -216,17 +224,16 @@ export class Runtime {
     const seen = new Set<string>();
 
     // Repo templates (user overrides) - take priority
-    const repoTemplatesDir = path.resolve(this.repoRoot, "docs", "templates");
     try {
-      const entries = await fs.readdir(repoTemplatesDir, { withFileTypes: true });
+      const entries = await fs.readdir(this.repoTemplatesDir, { withFileTypes: true });
       for (const entry of entries) {
         if (entry.isFile() && entry.name.endsWith(".md")) {
           const name = entry.name.replace(/\.md$/, "");
-          if (/^[a-zA-Z0-9_-]+$/.test(name)) {
+          if (TEMPLATE_NAME_PATTERN.test(name)) {
             templates.push({
               name,
               source: "repo",
-              path: path.join(repoTemplatesDir, entry.name)
+              path: path.join(this.repoTemplatesDir, entry.name)
             });
             seen.add(name);
           }
@@ -247,7 +254,7 @@ export class Runtime {
         for (const entry of entries) {
           if (entry.isFile() && entry.name.endsWith(".md")) {
             const name = entry.name.replace(/\.md$/, "");
-            if (/^[a-zA-Z0-9_-]+$/.test(name) && !seen.has(name)) {
+            if (TEMPLATE_NAME_PATTERN.test(name) && !seen.has(name)) {
               templates.push({
                 name,
                 source: "system",
@@ -274,12 +281,11 @@ export class Runtime {
     if (!trimmedName) {
       throw new Error("template name is required");
     }
-    if (!/^[a-zA-Z0-9_-]+$/.test(trimmedName)) {
+    if (!TEMPLATE_NAME_PATTERN.test(trimmedName)) {
       throw new Error("invalid template name: only alphanumeric, underscore, and hyphen allowed");
     }
 
-    const templatesDir = path.resolve(this.repoRoot, "docs", "templates");
-    const templatePath = path.join(templatesDir, `${trimmedName}.md`);
+    const templatePath = path.join(this.repoTemplatesDir, `${trimmedName}.md`);
 
     // Check if already exists
     try {
@@ -293,7 +299,7 @@ export class Runtime {
     }
 
     // Ensure directory exists and write file
-    await fs.mkdir(templatesDir, { recursive: true });
+    await fs.mkdir(this.repoTemplatesDir, { recursive: true });
     await fs.writeFile(templatePath, content, "utf8");
     this.logger.info("template created", { name: trimmedName, path: templatePath });
 
@@ -305,12 +311,11 @@ export class Runtime {
     if (!trimmedName) {
       throw new Error("template name is required");
     }
-    if (!/^[a-zA-Z0-9_-]+$/.test(trimmedName)) {
+    if (!TEMPLATE_NAME_PATTERN.test(trimmedName)) {
       throw new Error("invalid template name");
     }
 
-    const templatesDir = path.resolve(this.repoRoot, "docs", "templates");
-    const templatePath = path.join(templatesDir, `${trimmedName}.md`);
+    const templatePath = path.join(this.repoTemplatesDir, `${trimmedName}.md`);
 
     // Check if exists in repo (we only allow editing repo templates, not system)
     try {
@@ -324,7 +329,7 @@ export class Runtime {
           try {
             await fs.access(systemPath);
             // System template exists, create repo override
-            await fs.mkdir(templatesDir, { recursive: true });
+            await fs.mkdir(this.repoTemplatesDir, { recursive: true });
             await fs.writeFile(templatePath, content, "utf8");
             this.logger.info("system template overridden", { name: trimmedName, path: templatePath });
             return { name: trimmedName, path: templatePath };
@@ -348,12 +353,11 @@ export class Runtime {
     if (!trimmedName) {
       throw new Error("template name is required");
     }
-    if (!/^[a-zA-Z0-9_-]+$/.test(trimmedName)) {
+    if (!TEMPLATE_NAME_PATTERN.test(trimmedName)) {
       throw new Error("invalid template name");
     }
 
-    const templatesDir = path.resolve(this.repoRoot, "docs", "templates");
-    const templatePath = path.join(templatesDir, `${trimmedName}.md`);
+    const templatePath = path.join(this.repoTemplatesDir, `${trimmedName}.md`);
 
     // Only delete repo templates, not system templates
     try {
@@ -454,9 +458,23 @@ export class Runtime {
       return;
     }
 
-    for (const runId of runDirs) {
-      const snapshot = await this.readRunSnapshot(runId);
-      const runState = snapshot ?? (await this.rebuildRunStateFromEvents(runId));
+    // Snapshot reads are independent, so overlap them with a bounded pool of workers;
+    // rehydration stays in directory order below.
+    const loaded: Array<RunState | null> = new Array(runDirs.length).fill(null);
+    let nextIndex = 0;
+    const loadNext = async (): Promise<void> => {
+      while (nextIndex < runDirs.length) {
+        const index = nextIndex++;
+        const runId = runDirs[index];
+        const snapshot = await this.readRunSnapshot(runId);
+        loaded[index] = snapshot ?? (await this.rebuildRunStateFromEvents(runId));
+      }
+    };
+    const workers = Math.min(PERSISTED_RUN_LOAD_CONCURRENCY, runDirs.length);
+    await Promise.all(Array.from({ length: workers }, () => loadNext()));
+
+    for (const [index, runId] of runDirs.entries()) {
+      const runState = loaded[index];
       if (!runState) {
         this.logger.warn("skipping persisted run (no snapshot or events)", { runId });
         continue;
@@ -758,6 +776,7 @@ export class Runtime {
 
     this.store.deleteRun(runId);
     this.artifactStores.delete(runId);
+    await record.eventLog.close();
 
     try {
       await fs.rm(path.join(this.dataDir, "runs", runId), { recursive: true, force: true });
@@ -1073,12 +1092,17 @@ export class Runtime {
     void this.saveRunSnapshot(runId);
   }
 
-  async getArtifactContent(runId: UUID, artifactId: UUID): Promise<{ artifact: Artifact; content: string }> {
+  getArtifact(runId: UUID, artifactId: UUID): Artifact {
     const record = this.requireRun(runId);
     const artifact = record.artifacts.get(artifactId) ?? record.state.artifacts[artifactId];
     if (!artifact) {
       throw new Error(`Artifact ${artifactId} not found`);
     }
+    return artifact;
+  }
+
+  async getArtifactContent(runId: UUID, artifactId: UUID): Promise<{ artifact: Artifact; content: string }> {
+    const artifact = this.getArtifact(runId, artifactId);
     const content = await fs.readFile(artifact.path, "utf8");
     return { artifact, content };
   }
@@ -48,19 +48,19 @@ function normalizeRoot(root: string): string {
   return path.resolve(root);
 }
 
+// `root` must already be normalized via normalizeRoot; it is resolved once per tool call.
 function resolvePath(root: string, target: string): string {
   const resolved = path.resolve(root, target);
-  const safeRoot = normalizeRoot(root);
-  if (!resolved.startsWith(`${safeRoot}${path.sep}`) && resolved !== safeRoot) {
+  // A filesystem root ("/" or "C:\\") already ends with the separator.
+  const prefix = root.endsWith(path.sep) ? root : `${root}${path.sep}`;
+  if (!resolved.startsWith(prefix) && resolved !== root) {
     throw new Error(`Path escapes repo root: ${target}`);
   }
   return resolved;
 }
 
-function isDocsPath(root: string, target: string): boolean {
-  const safeRoot = normalizeRoot(root);
-  const resolved = resolvePath(safeRoot, target);
-  const relative = path.relative(safeRoot, resolved);
+function isDocsPath(root: string, resolved: string): boolean {
+  const relative = path.relative(root, resolved);
   return relative === DOCS_ROOT || relative.startsWith(`${DOCS_ROOT}${path.sep}`);
 }
 
@@ -77,15 +77,14 @@ function canRunCommands(options: ToolExecutionOptions): string | null {
   return null;
 }
 
-function canWritePath(options: ToolExecutionOptions, target: string): string | null {
+function canWritePath(options: ToolExecutionOptions, root: string, resolved: string): string | null {
   if (!options.capabilities && !options.globalMode) {
     return null;
   }
   if (options.capabilities?.delegateOnly) {
     return "delegateOnly is enabled";
   }
-  const root = options.cwd;
-  const docsPath = isDocsPath(root, target);
+  const docsPath = isDocsPath(root, resolved);
   if (options.globalMode === "PLANNING" && !docsPath) {
     return "write restricted to docs/ in PLANNING mode";
   }
@@ -196,7 +195,15 @@ function looksLikeToolCallFields(value: JsonObject): boolean {
   return Boolean(args);
 }
 
+const JSON_OBJECT_LINE_PATTERN = /^\s*\{/m;
+
 function findToolCallJsonLine(output: string): string | null {
+  // A tool call must sit on its own line starting with "{"; skip splitting (potentially
+  // megabytes of) command output that has no such line. Key names are not prefiltered
+  // because JSON escapes like "\u0061rgs" still parse to a tool call.
+  if (!JSON_OBJECT_LINE_PATTERN.test(output)) {
+    return null;
+  }
   const lines = output.split(/\r?\n/);
   for (const line of lines) {
     const trimmed = line.trim();
@@ -300,11 +307,15 @@ export async function executeToolCall(
       }
       try {
         const cwd = resolvePath(root, cwdInput);
+        // Collect raw buffers and decode once, instead of exec's per-chunk utf8 decoding.
         const result = await exec(cmd, {
           cwd,
+          encoding: "buffer",
           maxBuffer: 10 * 1024 * 1024
         });
-        const output = [result.stdout, result.stderr].filter(Boolean).join("");
+        const output = [result.stdout.toString("utf8"), result.stderr.toString("utf8")]
+          .filter(Boolean)
+          .join("");
         const toolCallLine = findToolCallJsonLine(output);
         if (toolCallLine) {
           return buildToolCallOutputError(tool, output, toolCallLine, options.logger);
@@ -312,8 +323,14 @@ export async function executeToolCall(
         return { ok: true, output };
       } catch (error) {
         const message = error instanceof Error ? error.message : String(error);
-        const stdout = (error as { stdout?: string }).stdout ?? "";
-        const stderr = (error as { stderr?: string }).stderr ?? "";
+        const stdout =
+          error instanceof Error && "stdout" in error && Buffer.isBuffer(error.stdout)
+            ? error.stdout.toString("utf8")
+            : "";
+        const stderr =
+          error instanceof Error && "stderr" in error && Buffer.isBuffer(error.stderr)
+            ? error.stderr.toString("utf8")
+            : "";
         const output = [stdout, stderr].filter(Boolean).join("");
         const toolCallLine = findToolCallJsonLine(output);
         if (toolCallLine) {
@@ -344,12 +361,12 @@ export async function executeToolCall(
       if (!target || content === null) {
         return { ok: false, output: "", error: "write_file requires path and content" };
       }
-      const guard = canWritePath(options, target);
-      if (guard) {
-        return { ok: false, output: "", error: guard };
-      }
       try {
         const resolved = resolvePath(root, target);
+        const guard = canWritePath(options, root, resolved);
+        if (guard) {
+          return { ok: false, output: "", error: guard };
+        }
         await fs.mkdir(path.dirname(resolved), { recursive: true });
         await fs.writeFile(resolved, content, "utf8");
         return { ok: true, output: `wrote ${target}` };
@@ -380,12 +397,12 @@ export async function executeToolCall(
       if (!target) {
         return { ok: false, output: "", error: "delete_file requires path" };
       }
-      const guard = canWritePath(options, target);
-      if (guard) {
-        return { ok: false, output: "", error: guard };
-      }
       try {
         const resolved = resolvePath(root, target);
+        const guard = canWritePath(options, root, resolved);
+        if (guard) {
+          return { ok: false, output: "", error: guard };
+        }
         await fs.rm(resolved, { force: true });
         return { ok: true, output: `deleted ${target}` };
       } catch (error) {
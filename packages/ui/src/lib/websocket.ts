@@ -4,6 +4,7 @@
  */
 
 import type { EventEnvelope } from '@vuhlp/contracts';
+import { getRunEvents } from './api';
 import { applyEventToStore } from './event-handlers';
 
 type ConnectionState = 'connecting' | 'connected' | 'disconnected' | 'error';
@@ -16,6 +17,7 @@ interface WebSocketClientOptions {
 }
 
 const DEFAULT_WS_URL = 'ws://localhost:4000';
+const RESYNC_PAGE_SIZE = 200;
 const DEBUG_WS = import.meta.env.VITE_DEBUG_WS === 'true';
 
 type WsUrlSource = 'env:VITE_WS_URL' | 'env:VITE_API_URL' | 'window' | 'default';
@@ -91,6 +93,7 @@ class WebSocketClient {
   private reconnectAttempts = 0;
   private maxReconnectAttempts = 5;
   private reconnectDelay = 1000;
+  private hasConnected = false;
   private onConnectionChange?: (state: ConnectionState) => void;
   private onEvent?: (event: EventEnvelope) => void;
 
@@ -110,12 +113,17 @@ class WebSocketClient {
     this.onConnectionChange?.('connecting');
     debugLog('[ws] connecting to', this.url);
 
-    this.ws = new WebSocket(`${this.url}/ws?runId=${encodeURIComponent(this.runId)}`);
+    const socket = new WebSocket(`${this.url}/ws?runId=${encodeURIComponent(this.runId)}`);
+    this.ws = socket;
 
     this.ws.onopen = () => {
       debugLog('[ws] connected');
       this.reconnectAttempts = 0;
       this.onConnectionChange?.('connected');
+      if (this.hasConnected) {
+        this.resyncAfterReconnect(socket);
+      }
+      this.hasConnected = true;
     };
 
     this.ws.onmessage = (event) => {
@@ -161,6 +169,29 @@ class WebSocketClient {
     }, delay);
   }
 
+  /**
+   * Events emitted while the socket was down (including when the daemon terminates a
+   * stalled or unresponsive socket) are not replayed, so refetch the latest page.
+   * applyEventToStore skips events already seen.
+   */
+  private resyncAfterReconnect(socket: WebSocket): void {
+    const runId = this.runId;
+    getRunEvents(runId, { limit: RESYNC_PAGE_SIZE })
+      .then((response) => {
+        if (this.ws !== socket) {
+          return;
+        }
+        debugLog('[ws] resyncing events after reconnect', { runId, count: response.events.length });
+        for (const event of response.events) {
+          applyEventToStore(event, { mode: 'live' });
+        }
+      })
+      .catch((err) => {
+        const message = err instanceof Error ? err.message : String(err);
+        console.error('[ws] failed to resync events after reconnect:', { runId, message });
+      });
+  }
+
   private handleEvent(event: EventEnvelope): void {
     if (this.onEvent) {
       this.onEvent(event);